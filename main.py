@@ -1,15 +1,20 @@
 import os
+import sys
 import time
-import requests
+import random
+import aiohttp
 from bs4 import BeautifulSoup
 import csv
 import logging
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 import re
 import asyncio
+from dataclasses import dataclass
+from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
 from playwright.async_api import async_playwright
-from zenrows import ZenRowsClient
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -22,175 +27,423 @@ logging.basicConfig(
 )
 
 ZENROWS_API_KEY = os.getenv("ZENROWS_API_KEY" , "")
+ZENROWS_API_URL = "https://api.zenrows.com/v1/"
 
 BASE_URL = "https://www.stepstone.de"
 START_URL = "https://www.stepstone.de/jobs/in-deutschland?radius=5&action=facet_selected%3bage%3bage_1&ag=age_1"
+MAX_CONCURRENT_JOBS = 5
+# Outbound request rate shared by ZenRows fetches and browser page loads
+REQUESTS_PER_SECOND = 5
+REQUEST_BURST = 10
+
+# Resource types not needed for text scraping, aborted to save bandwidth
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+
+# Reads all basic listing fields in a single round-trip to the browser
+LISTING_DETAILS_JS = """() => {
+    const text = (selector) => document.querySelector(selector)?.innerText?.trim() || null;
+    const company = document.querySelector('.at-listing__list-icons_company-name');
+    return {
+        title: text('h1'),
+        work_type: text('.at-listing__list-icons_work-type'),
+        location: text('.at-listing__list-icons_location'),
+        company: company?.innerText?.trim() || null,
+        href: company?.querySelector('a')?.getAttribute('href') || null,
+        date: text('.at-listing__list-icons_date'),
+    };
+}"""
+
+# Pre-compiled patterns used on every job listing
+TS_RE = re.compile(r'vor (\d+) (Stunden|Tage|Tag)')
+TEL_RE = re.compile(r"tel:")
+MAIL_RE = re.compile(r"mailto:")
+HTTP_RE = re.compile(r"https?://")
+EMAIL_FALLBACK = re.compile(r"[\w\.-]+@[\w\.-]+")
+SITE_FALLBACK = re.compile(r"https?://[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+COMPANY_HREF_RE = re.compile(r"/cmp/")
+# Contact person in the free-text additional-info panel, e.g. "Ihre Ansprechpartnerin: Frau Dr. Anna Schmidt"
+CONTACT_NAME_RE = re.compile(
+    r"(?:Ansprechpartner(?:in)?|Kontaktperson)\s*:?\s*"
+    r"(?:(?:Frau|Herr|Fr\.|Hr\.)\s+)?(?:(?:Dr|Prof)\.\s+)*"
+    r"([A-ZÄÖÜ][a-zäöüß']+(?:-[A-ZÄÖÜ][a-zäöüß']+)?(?:[ \t]+[A-ZÄÖÜ][a-zäöüß']+(?:-[A-ZÄÖÜ][a-zäöüß']+)?){1,2})"
+)
+
+@dataclass
+class JobPreview:
+    """Job details available from a search result card, before opening the listing."""
+    url: str
+    title: str = "N/A"
+    employment_type: str = "N/A"
+    location: str = "N/A"
+    company_name: str = "N/A"
+    company_page_href: str | None = None
+    date: str = ""
+
+class AsyncTokenBucket:
+    """Token bucket limiting how fast outbound requests are started."""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.ts = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and consume it."""
+        async with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.ts) * self.rate)
+            self.ts = now
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self.tokens = 0
+                self.ts = time.monotonic()
+            else:
+                self.tokens -= 1
 
-zenrows_client = ZenRowsClient(ZENROWS_API_KEY)
+request_bucket = AsyncTokenBucket(REQUESTS_PER_SECOND, REQUEST_BURST)
 
-def fetch_with_retry(url, params, retries=3, delay=2):
-    """Fetch a URL with retry mechanism."""
-    attempt = 0
-    while attempt < retries:
+# Shared HTTP session, created in main() and reused for all ZenRows requests
+http_session = None
+
+def parse_retry_after(value):
+    """Convert a Retry-After header (seconds or HTTP-date) to a delay in seconds."""
+    if not value:
+        return None
+    try:
+        return max(0, int(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        # "-0000" dates are parsed as naive, but HTTP-dates are always UTC
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+async def fetch_with_retry(url, params, retries=5, base_delay=1, max_delay=30, max_elapsed=120):
+    """Fetch a URL through the ZenRows API with exponential backoff and return its HTML.
+
+    Retries on 429 and 5xx responses, timeouts and connection errors, honouring
+    Retry-After on 429/503, and gives up once max_elapsed seconds would be
+    exceeded. Other 4xx errors are raised.
+    """
+    deadline = time.monotonic() + max_elapsed
+    for attempt in range(1, retries + 1):
+        await request_bucket.acquire()
         try:
-            response = zenrows_client.get(url, params=params)
-            response.raise_for_status()
-            return response
-        except requests.exceptions.HTTPError as e:
-            if response.status_code == 500:
-                attempt += 1
-                logging.warning(f"500 Server Error on attempt {attempt}/{retries}. Retrying after {delay} seconds...")
-                if attempt < retries:
-                    time.sleep(delay)
-            else:
-                raise e  # Raise non-500 errors
+            async with http_session.get(
+                ZENROWS_API_URL,
+                params={"apikey": ZENROWS_API_KEY, "url": url, **params},
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                status = response.status
+                if status != 429 and status < 500:
+                    response.raise_for_status()  # Raise non-retryable errors
+                    return await response.text()
+                retry_after = parse_retry_after(response.headers.get("Retry-After")) if status in (429, 503) else None
+                error = f"{status} error"
+        except aiohttp.ClientResponseError as e:
+            logging.error(f"Error occurred while fetching {url}: {str(e)}")
+            raise e
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            # Slow premium-proxy responses and dropped connections are transient
+            retry_after = None
+            error = f"{type(e).__name__} {str(e)}".strip()
         except Exception as e:
-            logging.error(f"Error occurred")
+            logging.error(f"Error occurred while fetching {url}: {str(e)}")
             raise e
-    logging.error(f"Failed to fetch {url} after {retries} attempts.")
+
+        if attempt == retries:
+            break
+        if retry_after is not None:
+            delay = retry_after
+        else:
+            delay = min(max_delay, base_delay * 2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
+        if time.monotonic() + delay > deadline:
+            logging.warning(f"Retry budget of {max_elapsed} seconds exhausted for {url}")
+            break
+        logging.warning(f"{error} on attempt {attempt}/{retries}. Retrying after {delay:.1f} seconds...")
+        await asyncio.sleep(delay)
+    logging.error(f"Failed to fetch {url} after {attempt} attempts.")
     return None  # Return None if all retries fail
 
-async def create_browsers(count):
-    """Create multiple browser instances"""
+async def create_browser():
+    """Create a single browser instance shared by all jobs"""
     scraping_browser = f'wss://browser.zenrows.com?apikey={ZENROWS_API_KEY}'
-    browsers = []
     playwright = await async_playwright().start()
+    browser = await playwright.chromium.connect_over_cdp(scraping_browser)
     
-    for _ in range(count):
-        browser = await playwright.chromium.connect_over_cdp(scraping_browser)
-        browsers.append(browser)
+    return playwright, browser
+
+async def block_resources(route):
+    """Abort requests for resource types that are not needed for scraping"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def process_jobs(url, max_concurrent=MAX_CONCURRENT_JOBS):
+    """Walk pagination and scrape jobs concurrently with a fixed pool of workers"""
+    queue = asyncio.Queue(maxsize=200)
+    playwright, browser = await create_browser()
     
-    return playwright, browsers
-
-async def process_jobs(job_links, max_concurrent=5):
-    """Process jobs concurrently with a maximum number of concurrent tasks"""
-    semaphore = asyncio.Semaphore(max_concurrent)
-    playwright, browsers = await create_browsers(max_concurrent)
+    logging.info(f"Created browser instance for {max_concurrent} concurrent jobs")
     
-    logging.info(f"Created {max_concurrent} browser instances")
-    
-    async def process_single_job(job_url, browser_index):
-        """Process a single job with semaphore control"""
-        async with semaphore:
-            try:
-                await scrape_job_listing(browsers[browser_index], job_url)
-            except Exception as e:
-                logging.error(f"Error processing job {job_url}: {str(e)}")
+    async def worker():
+        """Scrape queued jobs in one reusable browser context until a sentinel is received"""
+        context = await browser.new_context()
+        await context.route("**/*", block_resources)
+        try:
+            while True:
+                job = await queue.get()
+                if job is None:
+                    break
+                page = None
+                try:
+                    contact_task = None
+                    if job.company_page_href:
+                        # Start the contact lookup now so it overlaps with any page load below
+                        contact_task = asyncio.create_task(get_company_contact_details(job.company_page_href))
+                    # Only render the listing when the search result card is not enough
+                    if await scrape_job_preview(job, contact_task):
+                        continue
+                    page = await context.new_page()
+                    await scrape_job_listing(page, job, contact_task)
+                except Exception as e:
+                    logging.error(f"Error processing job {job.url}: {str(e)}")
+                finally:
+                    if page:
+                        await page.close()
+        finally:
+            consent_handled_contexts.discard(context)
+            await context.close()
     
     try:
-        # Create tasks for all jobs
-        tasks = []
-        for index, job_url in enumerate(job_links):
-            browser_index = index % max_concurrent
-            task = asyncio.create_task(process_single_job(job_url, browser_index))
-            tasks.append(task)
+        producer_task = asyncio.create_task(get_job_links(url, queue, max_concurrent))
+        workers = [asyncio.create_task(worker()) for _ in range(max_concurrent)]
         
-        # Wait for all tasks to complete
-        await asyncio.gather(*tasks)
+        # Pagination keeps running while workers scrape already queued jobs
+        await asyncio.gather(producer_task, *workers)
     finally:
-        # Clean up browsers
-        for browser in browsers:
-            await browser.close()
+        # Clean up browser
+        await browser.close()
         await playwright.stop()
 
-async def get_job_links(url):
-    job_links = []
-    page = 1
+def parse_job_preview(link):
+    """Build a JobPreview from a job link and the search result card around it."""
+    card = link.find_parent("article") or link.parent
+
+    def card_text(data_at):
+        tag = card.find(attrs={"data-at": data_at})
+        return tag.get_text(strip=True) if tag else "N/A"
+
+    company_link = card.find("a", href=COMPANY_HREF_RE)
+    date_tag = card.find("time")
+    return JobPreview(
+        url=BASE_URL + link["href"],
+        title=link.get_text(strip=True) or "N/A",
+        employment_type=card_text("job-item-work-type"),
+        location=card_text("job-item-location"),
+        company_name=card_text("job-item-company-name"),
+        company_page_href=urljoin(BASE_URL, company_link["href"]) if company_link else None,
+        date=date_tag.get_text(strip=True) if date_tag else ""
+    )
+
+def parse_listing_page(html):
+    """Parse a search results page into job previews and the total page count."""
+    soup = BeautifulSoup(html, "lxml")
+    
+    links = soup.find_all("a", class_="res-1foik6i")
+    job_links = [parse_job_preview(link) for link in links if "href" in link.attrs]
+    
     total_pages = None
-    current_url = START_URL + f"&page={page}"
+    pagination_nav = soup.find('nav', {'aria-label': 'pagination'})
+    if pagination_nav:
+        last_page_link = pagination_nav.find_all('li')[-2]
+        if last_page_link:
+            total_pages = int(last_page_link.text)
+    
+    return job_links, total_pages
 
-    while True:
-        try:
-            logging.info(f"Fetching page {page}")
-            response = fetch_with_retry(
-                current_url,
-                params={"premium_proxy": "true", "proxy_country": "de"}
-            )
-            
-            if not response:
-                logging.warning(f"Skipping page {page} due to repeated failures.")
-                break
-            
-            soup = BeautifulSoup(response.text, "html.parser")
-            
-            links = soup.find_all("a", class_="res-1foik6i")
-            new_links = [BASE_URL + link["href"] for link in links if "href" in link.attrs]
-            job_links.extend(new_links)
-            logging.info(f"Found {len(new_links)} job links on page {page}")
-            
-            if total_pages is None:
-                pagination_nav = soup.find('nav', {'aria-label': 'pagination'})
-                if pagination_nav:
-                    last_page_link = pagination_nav.find_all('li')[-2]
-                    if last_page_link:
-                        total_pages = int(last_page_link.text)
-                        logging.info(f"Total pages: {total_pages}")
-            
-            if total_pages and page >= total_pages:
-                logging.info(f"Reached the last page: {total_pages}")
-                break
+async def get_job_links(url, queue, worker_count):
+    """Walk the search result pages and enqueue job links for the workers."""
+    total_links = 0
+    seen = set()
+    page = 1
+    total_pages = None
+    current_url = url + f"&page={page}"
 
-            logging.info(f"Found {len(job_links)} jobs to scrape")
-            
-            # Process jobs concurrently
-            await process_jobs(job_links)
-            
-            # Clear job links after processing to avoid processing them again
-            job_links = []
-            
-            page += 1
-            current_url = START_URL + f"&page={page}"
+    try:
+        while True:
+            try:
+                logging.info(f"Fetching page {page}")
+                html = await fetch_with_retry(
+                    current_url,
+                    params={"premium_proxy": "true", "proxy_country": "de"}
+                )
+                
+                if not html:
+                    logging.warning(f"Skipping page {page} due to repeated failures.")
+                    break
+                
+                # Parse off the event loop so concurrent scrapes are not blocked
+                new_links, page_count = await asyncio.to_thread(parse_listing_page, html)
+                # Listings often repeat across adjacent pages, only queue each one once
+                new_links = [job for job in new_links if not (job.url in seen or seen.add(job.url))]
+                logging.info(f"Found {len(new_links)} new job links on page {page}")
+                
+                for job in new_links:
+                    await queue.put(job)
+                total_links += len(new_links)
+                
+                if total_pages is None and page_count:
+                    total_pages = page_count
+                    logging.info(f"Total pages: {total_pages}")
+                
+                if total_pages and page >= total_pages:
+                    logging.info(f"Reached the last page: {total_pages}")
+                    break
+                
+                page += 1
+                current_url = url + f"&page={page}"
 
-        except Exception as e:
-            logging.error(f"Error occurred while fetching job links: {str(e)}")
-            break
+            except Exception as e:
+                logging.error(f"Error occurred while fetching job links: {str(e)}")
+                break
+    finally:
+        # One sentinel per worker so every worker shuts down
+        for _ in range(worker_count):
+            await queue.put(None)
             
-    logging.info(f"Total job links found: {len(job_links)}")
-    return job_links
+    logging.info(f"Total job links found: {total_links}")
+    return total_links
+
+def parse_contact_html(html):
+    """Parse a company contact page into website, name, position, phone and email."""
+    soup = BeautifulSoup(html, "lxml")
+    ul = soup.find("ul")
+    website_tag = ul.find("a", href=True) if ul else None
+    website = website_tag["href"] if website_tag else "N/A"
+
+    # Collect all contact fields in one pass, keeping the first match of each
+    tags = {}
+    for tag in soup.select("span.at-contact-name, span.at-contact-position, a.at-contact-phone, a.at-contact-email"):
+        for css_class in tag.get("class", []):
+            tags.setdefault(css_class, tag)
+
+    contact_name = tags["at-contact-name"].text.strip() if "at-contact-name" in tags else "N/A"
+    contact_position = tags["at-contact-position"].text.strip() if "at-contact-position" in tags else "N/A"
+    contact_phone = tags["at-contact-phone"].text.strip() if "at-contact-phone" in tags else "N/A"
+    contact_email_tag = tags.get("at-contact-email")
+    contact_email = contact_email_tag['href'].replace("mailto:", "") if contact_email_tag and contact_email_tag.has_attr('href') else "N/A"
+
+    return website, contact_name, contact_position, contact_phone, contact_email
+
+# Contact lookups per contact page URL, shared by all jobs of the same company
+contact_cache = {}
+
+def company_contact_url(company_website):
+    """Map a company jobs page to its contact page"""
+    return company_website.replace("/jobs.html", "/kontakte.html#menu")
+
+def get_cached_contact_details(company_website):
+    """Return contact details already fetched for a company, or None without fetching."""
+    task = contact_cache.get(company_contact_url(company_website))
+    if task is None or not task.done() or task.cancelled():
+        return None
+    return task.result()
+
+async def get_company_contact_details(company_website):
+    """Get company contact details, fetching each company's contact page only once."""
+    contact_url = company_contact_url(company_website)
+    task = contact_cache.get(contact_url)
+    if task is None:
+        # Store the task itself so concurrent jobs of the same company share one fetch
+        task = asyncio.create_task(fetch_company_contact_details(contact_url, company_website))
+        contact_cache[contact_url] = task
+    else:
+        logging.info(f"Using cached company contact details for: {contact_url}")
+    result = await asyncio.shield(task)
+    if result is None:
+        # Only keep successful lookups so a failed fetch is retried by the next job
+        if contact_cache.get(contact_url) is task:
+            contact_cache.pop(contact_url, None)
+        return "N/A", "N/A", "N/A", "N/A", "N/A"
+    return result
 
-def get_company_contact_details(company_website):
-    """Get company contact details using ScrapingBee with retry."""
+async def fetch_company_contact_details(contact_url, company_website):
+    """Fetch company contact details using ZenRows with retry, or None if the fetch failed."""
     try:
-        contact_url = company_website.replace("/jobs.html", "/kontakte.html#menu")
         logging.info(f"Fetching company contact details from: {contact_url}")
         
-        response = response = fetch_with_retry(
+        html = await fetch_with_retry(
                 contact_url,
                 params = {"premium_proxy":"true","proxy_country":"de"}
             )
         
-        if not response:
+        if not html:
             logging.warning(f"Skipping contact details for {company_website} due to repeated failures.")
-            return "N/A", "N/A", "N/A", "N/A", "N/A"
+            return None
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        ul = soup.find_all("ul")[0] if soup.find("ul") else None
-        website = ul.find("a")["href"] if ul and ul.find("a") else "N/A"
-        contact_name_tag = soup.find('span', class_="at-contact-name")
-        contact_name = contact_name_tag.text.strip() if contact_name_tag else "N/A"
-        contact_position_tag = soup.find('span', class_="at-contact-position")
-        contact_position = contact_position_tag.text.strip() if contact_position_tag else "N/A"
-        contact_phone_tag = soup.find('a', class_="at-contact-phone")
-        contact_phone = contact_phone_tag.text.strip() if contact_phone_tag else "N/A"
-        contact_email_tag = soup.find('a', class_="at-contact-email")
-        contact_email = contact_email_tag['href'].replace("mailto:", "") if contact_email_tag else "N/A"
-
-        return website, contact_name, contact_position, contact_phone, contact_email
+        return await asyncio.to_thread(parse_contact_html, html)
     except Exception as e:
-        logging.warning(f"Failed to fetch contact details")
-        return "N/A", "N/A", "N/A", "N/A", "N/A"
+        logging.warning(f"Failed to fetch contact details: {str(e)}")
+        return None
+
+def parse_additional_info_html(html):
+    """Parse the additional-info panel into phone, email, website, name and position."""
+    soup = BeautifulSoup(html, "lxml")
+    text_content = soup.get_text(separator="\n").strip()
+
+    # Extract contact information
+    phone_tag = soup.find('a', href=TEL_RE)
+    email_tag = soup.find('a', href=MAIL_RE)
+    website_tag = soup.find('a', href=HTTP_RE)
+
+    phone = phone_tag.get_text(strip=True) if phone_tag else None
+    email = email_tag.get_text(strip=True) if email_tag else None
+    website = website_tag.get_text(strip=True) if website_tag else None
+    contact_name_tag = soup.find(class_="at-contact-name")
+    if contact_name_tag:
+        contact_name = contact_name_tag.get_text(strip=True)
+    else:
+        contact_name_match = CONTACT_NAME_RE.search(text_content)
+        contact_name = contact_name_match.group(1) if contact_name_match else "N/A"
+    contact_position_tag = soup.find(class_="at-contact-position")
+    contact_position = contact_position_tag.get_text(strip=True) if contact_position_tag else "N/A"
+
+    # Fallback to regex patterns if needed
+    if not email:
+        email_match = EMAIL_FALLBACK.search(text_content)
+        email = email_match.group(0) if email_match else "N/A"
+
+    if not website:
+        website_match = SITE_FALLBACK.search(text_content)
+        website = website_match.group(0) if website_match else "N/A"
+
+    return phone or "N/A", email, website, contact_name, contact_position
+
+# Browser contexts whose cookie banner has already been handled
+consent_handled_contexts = set()
 
 async def get_additional_contact_details(page):
     """Get additional contact details using Playwright"""
     logging.info("Fetching additional contact information...")
     try:
-        # Handle cookie acceptance if present
-        try:
-            accept_button = page.locator("#ccmgt_explicit_accept")
-            await accept_button.click()
-            await page.wait_for_timeout(1000)
-        except Exception:
-            logging.info("No cookie acceptance button found or already accepted.")
+        # Handle cookie acceptance once per context; the banner is injected after
+        # DOMContentLoaded, so wait briefly for it instead of checking visibility
+        if page.context not in consent_handled_contexts:
+            consent_handled_contexts.add(page.context)
+            try:
+                accept_button = page.locator("#ccmgt_explicit_accept")
+                await accept_button.click(timeout=5000)
+                await page.wait_for_timeout(1000)
+            except Exception:
+                logging.info("No cookie acceptance button found or already accepted.")
 
         # Handle login modal if present
         try:
@@ -209,141 +462,203 @@ async def get_additional_contact_details(page):
             additional_info = page.locator(".at-section-text-additionalInformation")
             content = await additional_info.inner_html()
             
-            soup = BeautifulSoup(content, "html.parser")
-            text_content = soup.get_text(separator="\n").strip()
-
-            # Extract contact information
-            phone_tag = soup.find('a', href=re.compile(r"tel:"))
-            email_tag = soup.find('a', href=re.compile(r"mailto:"))
-            website_tag = soup.find('a', href=re.compile(r"https?://"))
-
-            phone = phone_tag.get_text(strip=True) if phone_tag else None
-            email = email_tag.get_text(strip=True) if email_tag else None
-            website = website_tag.get_text(strip=True) if website_tag else None
-
-            # Fallback to regex patterns if needed
-            if not email:
-                email_match = re.search(r"[\w\.-]+@[\w\.-]+", text_content)
-                email = email_match.group(0) if email_match else "N/A"
-
-            if not website:
-                website_match = re.search(r"https?://[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", text_content)
-                website = website_match.group(0) if website_match else "N/A"
-
-            return phone or "N/A", email, website
+            return await asyncio.to_thread(parse_additional_info_html, content)
         except Exception as e:
             logging.warning(f"Failed to get additional contact details")
-            return "N/A", "N/A", "N/A"
+            return "N/A", "N/A", "N/A", "N/A", "N/A"
     except Exception as e:
         logging.error(f"Error in get_additional_contact_details")
-        return "N/A", "N/A", "N/A"
+        return "N/A", "N/A", "N/A", "N/A", "N/A"
 
-async def scrape_job_listing(browser, url):
-    """Scrape individual job listing using Playwright"""
+def build_job_row(job_title, employment_type, location, company_name, website,
+                  contact_name, contact_position, contact_phone, contact_email, job_listing_timestamp):
+    """Build a CSV row, splitting the contact name and resolving the listing timestamp"""
+    # Split contact name
+    contact_first_name, contact_last_name = "N/A", "N/A"
+    if contact_name != "N/A":
+        name_parts = contact_name.split(" ")
+        contact_first_name = name_parts[0]
+        contact_last_name = " ".join(name_parts[1:]) if len(name_parts) > 1 else "N/A"
+
+    # Handle German format "Erschienen: vor X Stunden/Tagen"
+    timestamp_match = TS_RE.search(job_listing_timestamp)
+    
+    if timestamp_match:
+        amount = int(timestamp_match.group(1))
+        unit = timestamp_match.group(2)
+        
+        if unit == 'Stunden':
+            job_listing_timestamp = (datetime.now() - timedelta(hours=amount)).isoformat()
+        elif unit in ['Tage', 'Tag']:
+            job_listing_timestamp = (datetime.now() - timedelta(days=amount)).isoformat()
+        else:
+            job_listing_timestamp = datetime.now().isoformat()
+    else:
+        job_listing_timestamp = datetime.now().isoformat()
+
+    return [
+        job_title.strip(), employment_type.strip(), location.strip(), 
+        company_name.strip(), website, contact_name, contact_first_name, 
+        contact_last_name, contact_position, contact_phone, contact_email, 
+        "Stepstone", job_listing_timestamp, datetime.now().isoformat(), 
+        str(uuid.uuid4())
+    ]
+
+async def scrape_job_preview(preview, contact_task):
+    """Save a job straight from its search result card, without opening a browser page.
+
+    contact_task is the running contact lookup for the card's company link, if any.
+    Returns False when the card or the company contact page is missing details,
+    in which case the listing has to be scraped with Playwright.
+    """
+    if contact_task is None:
+        return False
+    if "N/A" in (preview.title, preview.employment_type, preview.location, preview.company_name):
+        return False
+
+    website, contact_name, contact_position, contact_phone, contact_email = await contact_task
+    if "N/A" in (website, contact_name, contact_phone, contact_email):
+        return False
+
+    row = build_job_row(
+        preview.title, preview.employment_type, preview.location, preview.company_name,
+        website, contact_name, contact_position, contact_phone, contact_email, preview.date
+    )
+    await write_to_csv(row)
+    logging.info(f"Buffered job listing for CSV from search results without browser: {preview.url}")
+    return True
+
+async def scrape_job_listing(page, preview, contact_task=None):
+    """Scrape individual job listing using Playwright
+
+    contact_task is a contact lookup already started from the search result card;
+    its result is reused instead of fetching the company contact page again.
+    """
+    url = preview.url
     logging.info(f"Starting to scrape job listing from URL: {url}")
 
     try:
-        page = await browser.new_page()
-        await page.goto(url)
+        # The listing selectors are in the initial DOM, no need to wait for full load
+        await request_bucket.acquire()
+        await page.goto(url, wait_until="domcontentloaded")
         logging.info("Page loaded successfully")
         
-        # Extract basic job details
-        job_title = await page.inner_text("h1")
-        employment_type = await page.inner_text(".at-listing__list-icons_work-type")
-        location = await page.inner_text(".at-listing__list-icons_location")
-        
-        company_element = await page.locator(".at-listing__list-icons_company-name").element_handle()
-        company_name = await company_element.inner_text()
-        company_link = await company_element.query_selector('a')
-        company_page_href = await company_link.get_attribute('href') if company_link else None
+        # Extract basic job details in one evaluate instead of a round-trip per field
+        await page.wait_for_selector(".at-listing__list-icons_company-name")
+        details = await page.evaluate(LISTING_DETAILS_JS)
+        job_title = details["title"] or "N/A"
+        employment_type = details["work_type"] or "N/A"
+        location = details["location"] or "N/A"
+        company_name = details["company"] or "N/A"
+        company_page_href = details["href"] or preview.company_page_href
+        job_listing_timestamp = details["date"] or ""
 
         # Get company contact details
         if company_page_href:
-            website, contact_name, contact_position, contact_phone, contact_email = get_company_contact_details(company_page_href)
-            
-            # Try to get additional contact details
-            add_phone, add_email, add_website = await get_additional_contact_details(page)
+            # Read the in-page details first and only fetch the company contact page if something is missing,
+            # unless the lookup was already started from the search result card
+            add_phone, add_email, add_website, add_name, add_position = await get_additional_contact_details(page)
+            if contact_task is None and "N/A" in (add_phone, add_email, add_website, add_name):
+                contact_task = asyncio.create_task(get_company_contact_details(company_page_href))
+            if contact_task is not None:
+                website, contact_name, contact_position, contact_phone, contact_email = await contact_task
+            else:
+                logging.info("All contact details found on the listing page, skipping company contact page")
+                # Still prefer the contact page if another job already fetched it
+                cached = get_cached_contact_details(company_page_href)
+                website, contact_name, contact_position, contact_phone, contact_email = cached or ("N/A", "N/A", "N/A", "N/A", "N/A")
             
             # Use additional details if main ones are not available
             contact_phone = contact_phone if contact_phone != "N/A" else add_phone
             contact_email = contact_email if contact_email != "N/A" else add_email
             website = website if website != "N/A" else add_website
+            contact_name = contact_name if contact_name != "N/A" else add_name
+            contact_position = contact_position if contact_position != "N/A" else add_position
         else:
             website, contact_name, contact_position, contact_phone, contact_email = "N/A", "N/A", "N/A", "N/A", "N/A"
         
-        # Split contact name
-        contact_first_name, contact_last_name = "N/A", "N/A"
-        if contact_name != "N/A":
-            name_parts = contact_name.split(" ")
-            contact_first_name = name_parts[0]
-            contact_last_name = " ".join(name_parts[1:]) if len(name_parts) > 1 else "N/A"
-
-        # Get timestamp
-        job_listing_timestamp = await page.inner_text(".at-listing__list-icons_date")
-        # Handle German format "Erschienen: vor X Stunden/Tagen"
-        timestamp_match = re.search(r'vor (\d+) (Stunden|Tage|Tag)', job_listing_timestamp)
-        
-        if timestamp_match:
-            amount = int(timestamp_match.group(1))
-            unit = timestamp_match.group(2)
-            
-            if unit == 'Stunden':
-                job_listing_timestamp = (datetime.now() - timedelta(hours=amount)).isoformat()
-            elif unit in ['Tage', 'Tag']:
-                job_listing_timestamp = (datetime.now() - timedelta(days=amount)).isoformat()
-            else:
-                job_listing_timestamp = datetime.now().isoformat()
-        else:
-            job_listing_timestamp = datetime.now().isoformat()
-
         # Save to CSV
-        row = [
-            job_title.strip(), employment_type.strip(), location.strip(), 
-            company_name.strip(), website, contact_name, contact_first_name, 
-            contact_last_name, contact_position, contact_phone, contact_email, 
-            "Stepstone", job_listing_timestamp, datetime.now().isoformat(), 
-            str(uuid.uuid4())
-        ]
-        write_to_csv(row)
-        logging.info("Successfully saved job listing to CSV")
-
-        await page.close()
+        row = build_job_row(
+            job_title, employment_type, location, company_name, website,
+            contact_name, contact_position, contact_phone, contact_email, job_listing_timestamp
+        )
+        await write_to_csv(row)
+        logging.info("Buffered job listing for CSV")
 
     except Exception as e:
         logging.error(f"Failed to scrape job listing from {url} {str(e)}")
-        try:
-            await page.close()
-        except:
-            pass
 
-def write_to_csv(data):
-    """Write job data to CSV file"""
-    try:
-        file_exists = os.path.isfile('jobs.csv')
-        mode = 'a' if file_exists else 'w'
-        
-        with open('jobs.csv', mode, newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            if not file_exists:
-                writer.writerow([
-                    "Job Title", "Employment Type", "Location", "Company Name",
-                    "Company Website", "Contact Full Name", "Contact First Name",
-                    "Contact Last Name", "Contact Position", "Contact Phone",
-                    "Contact Email", "Platform", "Job Listing Timestamp",
-                    "Scraping Timestamp", "Job ID"
-                ])
-            writer.writerow(data)
-            logging.info("Successfully wrote data to CSV")
-    except Exception as e:
-        logging.error(f"Error writing to CSV")
+CSV_PATH = 'jobs.csv'
+CSV_HEADER = [
+    "Job Title", "Employment Type", "Location", "Company Name",
+    "Company Website", "Contact Full Name", "Contact First Name",
+    "Contact Last Name", "Contact Position", "Contact Phone",
+    "Contact Email", "Platform", "Job Listing Timestamp",
+    "Scraping Timestamp", "Job ID"
+]
+
+CSV_FLUSH_ROWS = 25
+
+# CSV file and writer kept open for the whole run, set up by open_csv()
+csv_file = None
+csv_writer = None
+# Rows waiting to be written, flushed in batches of CSV_FLUSH_ROWS
+csv_buffer = []
+csv_lock = asyncio.Lock()
+
+def open_csv():
+    """Open the output CSV once, writing the header if the file is new or empty"""
+    global csv_file, csv_writer
+    is_empty = not os.path.isfile(CSV_PATH) or os.path.getsize(CSV_PATH) == 0
+    csv_file = open(CSV_PATH, 'a', newline='', encoding='utf-8', buffering=1 << 20)
+    csv_writer = csv.writer(csv_file)
+    if is_empty:
+        csv_writer.writerow(CSV_HEADER)
+
+async def write_to_csv(data):
+    """Buffer job data and write it to the CSV file once the buffer is full"""
+    csv_buffer.append(data)
+    if len(csv_buffer) >= CSV_FLUSH_ROWS:
+        await flush_csv()
+
+async def flush_csv():
+    """Write all buffered rows to the CSV file off the event loop"""
+    async with csv_lock:
+        if not csv_buffer:
+            return
+        rows = csv_buffer[:]
+        csv_buffer.clear()
+        try:
+            await asyncio.to_thread(csv_writer.writerows, rows)
+            logging.info(f"Successfully wrote {len(rows)} rows to CSV")
+        except Exception as e:
+            logging.error(f"Error writing {len(rows)} rows to CSV, rows dropped: {str(e)}")
 
 async def main():
+    global http_session
     logging.info("Starting the scraping process")
+    # Size the default executor used by asyncio.to_thread for HTML parsing
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=MAX_CONCURRENT_JOBS * 2)
+    )
+    http_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=64, keepalive_timeout=30)
+    )
+    open_csv()
     try:
-        await get_job_links(START_URL)
+        await process_jobs(START_URL)
         logging.info("Scraping process completed")
     except Exception as e:
         logging.error(f"Main process error: {str(e)}")
+    finally:
+        await http_session.close()
+        await flush_csv()
+        csv_file.close()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # uvloop is not available on Windows, fall back to the default event loop there
+    if sys.platform != 'win32':
+        import uvloop
+        uvloop.run(main())
+    else:
+        asyncio.run(main())